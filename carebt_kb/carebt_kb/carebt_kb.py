@@ -16,16 +16,22 @@ from carebt_msgs.srv import KbQuery
 from carebt_msgs.action import KbEvalState
 from carebt_kb.owlready2_kb import OwlReady2Kb
 from carebt_kb.plugin_base import import_class
-import json
+import orjson
 import rclpy
 from rclpy.action import ActionServer, CancelResponse
 from rclpy.node import Node
 from rclpy.callback_groups import ReentrantCallbackGroup
 from rclpy.executors import MultiThreadedExecutor
 from rclpy.action.server import ServerGoalHandle
+from rclpy.logging import LoggingSeverity
 import threading
 
 
+def _json_dumps(obj) -> str:
+    # orjson serializes datetime, date and time values as ISO 8601 strings
+    return orjson.dumps(obj).decode()
+
+
 # parameter constants
 KB_FILE_PARAM = 'kb_file'
 KB_PERSIST_PARAM = 'kb_persist'
@@ -55,6 +61,15 @@ class KbServer(Node):
         self.get_logger().info(f'kb created.')
 
         # create crud service
+        self.__crud_operations = {
+            'CREATE': self.__crud_create,
+            'READ': self.__crud_read,
+            'READ_ITEMS': self.__crud_read_items,
+            'UPDATE': self.__crud_update,
+            'UPDATE_ITEMS': self.__crud_update_items,
+            'DELETE': self.__crud_delete,
+            'DELETE_ITEMS': self.__crud_delete_items,
+        }
         self.create_service(KbQuery, 'carebt_kb/query', self.__crud_query_callback)
 
         # create wait_state action server
@@ -86,6 +101,8 @@ class KbServer(Node):
     ## wait_eval_state action-server callbacks
 
     def __wait_eval_state_execute_callback(self, goal_handle: ServerGoalHandle):
+        # the eval expression is compiled only once per goal
+        eval_code = None
         while True:
             goal: KbEvalState.Goal = goal_handle.request
             if not goal_handle.is_active:
@@ -97,10 +114,12 @@ class KbServer(Node):
                 self.get_logger().info("execute_callback -- Goal canceled")
                 return KbEvalState.Result()
 
-            filter = json.loads(goal.filter)
+            filter = orjson.loads(goal.filter)
             result = self.read(filter)
             try:
-                if(eval(goal.eval)):
+                if eval_code is None:
+                    eval_code = compile(goal.eval, '<eval>', 'eval')
+                if(eval(eval_code)):
                     break
             except Exception as e:
                 msg = f'eval: {goal.eval} -- EXCEPTION: {e}'
@@ -123,55 +142,54 @@ class KbServer(Node):
     ## CRUD query callback
 
     def __crud_query_callback(self, request: KbQuery.Request, response: KbQuery.Response):
-        self.get_logger().info(
-            f'Incoming request: {request.operation}, filter: {request.filter}, data: {request.data}')
-
-        # create
-        if(request.operation.upper() == 'CREATE'):
-            frame = json.loads(request.data)
-            result = []
-            result.append(self.create(frame))
-            response.response = json.dumps(result)
-        # read
-        elif(request.operation.upper() == 'READ'):
-            filter = json.loads(request.filter)
-            result = self.read(filter)
-            response.response = json.dumps(result)
-        # read_items
-        elif(request.operation.upper() == 'READ_ITEMS'):
-            items = json.loads(request.filter)['items']
-            result = self.read_items(items)
-            response.response = json.dumps(result)
-        # update
-        elif(request.operation.upper() == 'UPDATE'):
-            filter = json.loads(request.filter)
-            update = json.loads(request.data)
-            result = self.update(filter, update)
-            response.response = json.dumps(result)
-        # update_items
-        elif(request.operation.upper() == 'UPDATE_ITEMS'):
-            items = json.loads(request.filter)['items']
-            update = json.loads(request.data)
-            result = self.update_items(items, update)
-            response.response = json.dumps(result)
-        # delete
-        elif(request.operation.upper() == 'DELETE'):
-            filter = json.loads(request.filter)
-            self.delete(filter)
-            result = []
-            response.response = json.dumps(result)
-        # delete_items
-        elif(request.operation.upper() == 'DELETE_ITEMS'):
-            items = json.loads(request.filter)['items']
-            result = self.delete_items(items)
-            result = []
-            response.response = json.dumps(result)
+        # the rclpy logger takes preformatted messages only, so check the
+        # severity first to avoid formatting the message if it is dropped
+        if self.get_logger().is_enabled_for(LoggingSeverity.INFO):
+            self.get_logger().info(
+                f'Incoming request: {request.operation}, filter: {request.filter}, '
+                f'data: {request.data}')
+
+        crud_operation = self.__crud_operations.get(request.operation.upper())
+        if crud_operation is not None:
+            response.response = _json_dumps(crud_operation(request))
         else:
             print(f'unsupported operation ({request.operation}), '
                   + 'use: CREATE/READ/READ_ITEMS/UPDATE/UPDATE_ITEMS/DELETE/DELETE_ITEMS')
 
         return response
 
+    def __crud_create(self, request: KbQuery.Request):
+        frame = orjson.loads(request.data)
+        return [self.create(frame)]
+
+    def __crud_read(self, request: KbQuery.Request):
+        filter = orjson.loads(request.filter)
+        return self.read(filter)
+
+    def __crud_read_items(self, request: KbQuery.Request):
+        items = orjson.loads(request.filter)['items']
+        return self.read_items(items)
+
+    def __crud_update(self, request: KbQuery.Request):
+        filter = orjson.loads(request.filter)
+        update = orjson.loads(request.data)
+        return self.update(filter, update)
+
+    def __crud_update_items(self, request: KbQuery.Request):
+        items = orjson.loads(request.filter)['items']
+        update = orjson.loads(request.data)
+        return self.update_items(items, update)
+
+    def __crud_delete(self, request: KbQuery.Request):
+        filter = orjson.loads(request.filter)
+        self.delete(filter)
+        return []
+
+    def __crud_delete_items(self, request: KbQuery.Request):
+        items = orjson.loads(request.filter)['items']
+        self.delete_items(items)
+        return []
+
     ## the Kb CRUD operations
 
     def create(self, frame) -> str:
@@ -218,7 +236,7 @@ class KbServer(Node):
         return self.__kb.get_individuals_of(class_str)
 
     def is_individual_of(self, individual_str: str, class_str: str) -> bool:
-        return self.__kb(individual_str, class_str)
+        return self.__kb.is_individual_of(individual_str, class_str)
 
 
 def main(args=None):
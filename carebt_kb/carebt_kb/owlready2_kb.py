@@ -12,18 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 from owlready2 import *
 
 
 class OwlReady2Kb():
 
-    OWL_KEYWORDS = ['iri', 'is_a', 'name', 'namespace', 'storid']
+    OWL_KEYWORDS = frozenset(['iri', 'is_a', 'name', 'namespace', 'storid'])
 
     def __init__(self, filename: str, sync_to_file: bool = False):
         self.__filename = filename
         self.__sync_on = sync_to_file
+        # set if the kb has been changed since it was saved the last time
+        self.__dirty = False
         self.__onto = filename.split('/')[-1].split('.')[0]
         self.__onto_inferrences = self.__onto + '_inferrences'
+        # properties of the ontology, indexed by their name
+        self.__properties = {}
 
         # load ontology from file
         exec(f'self.{self.__onto} = get_ontology(filename).load()')
@@ -47,6 +53,11 @@ class OwlReady2Kb():
                 pass
         return items
 
+    def __get_property(self, key: str):
+        if key not in self.__properties:
+            self.__properties[key] = getattr(getattr(self, self.__onto), key)
+        return self.__properties[key]
+
     def __onto_to_dict(self, clazz: ThingClass):
         dict_str: str = '{'
         dict_str += f'\'iri\': \'{clazz.iri}\', '
@@ -58,7 +69,7 @@ class OwlReady2Kb():
         for prop in clazz.get_properties():
             is_functional = prop.is_functional_for(clazz.__class__)
             key_type = prop.range[0]
-            value = eval(f"self.{clazz}.{prop.name}")
+            value = getattr(clazz, prop.name)
             # owlready2.entity.ThingClass
             if key_type.__class__ is owlready2.entity.ThingClass: 
                 if is_functional:
@@ -146,14 +157,13 @@ class OwlReady2Kb():
         for key in frame.keys():
             if key == 'type':
                 continue
-            if eval(f'self.{self.__onto}.{key}') == None:
+            prop = self.__get_property(key)
+            if prop == None:
                 print(f'The key {key} is not part of the ontology.')
                 continue
             if key not in self.OWL_KEYWORDS:
-                range = eval(f'self.{self.__onto}.{key}.range')
-                clazz = frame['type']
-                clazz  # supress unused variable warning 
-                is_functional = eval(f'self.{self.__onto}.{key}.is_functional_for(clazz)')
+                range = prop.range
+                is_functional = prop.is_functional_for(frame['type'])
                 key_type = range[0]
                 # owlready2.entity.ThingClass
                 if key_type.__class__ is owlready2.entity.ThingClass:
@@ -234,7 +244,7 @@ class OwlReady2Kb():
     def __update(self, item, update):
         typed_update = self.__dict_to_typed_dict(update)
         for k in typed_update.keys():
-            if k in ['type']:
+            if k == 'type':
                 continue
             if k not in self.OWL_KEYWORDS:
                 try:
@@ -245,7 +255,7 @@ class OwlReady2Kb():
                 print(f'update - do not use key: {k}')
 
     def __sync_to_file(self):
-        if self.__sync_on:
+        if self.__sync_on and self.__dirty:
             self.save()
 
     # PUBLIC
@@ -260,6 +270,7 @@ class OwlReady2Kb():
             item = eval(onto_str)
             # update item
             self.__update(item, frame)
+            self.__dirty = True
             self.__sync_to_file()
             return str(item)
 
@@ -280,23 +291,27 @@ class OwlReady2Kb():
         for item in self.__get_items(filter):
             update['type'] = eval(f'self.{item}.__class__')
             self.__update(item, update)
+            self.__dirty = True
         self.__sync_to_file()
 
     def update_items(self, items, update):
         for item in items:
             update['type'] = eval(f'self.{item}.__class__')
             self.__update(item, update)
+            self.__dirty = True
         self.__sync_to_file()
 
     def delete(self, filter):
         for item in self.__get_items(filter):
             destroy_entity(item)
+            self.__dirty = True
         self.__sync_to_file()
 
     def delete_items(self, items):
         for item in items:
             o = eval(f'self.{item}')
             destroy_entity(o)
+            self.__dirty = True
         self.__sync_to_file()
 
     def get_classes(self):
@@ -349,4 +364,14 @@ class OwlReady2Kb():
                 print('UNKNOWN REASONER')
 
     def save(self):
-        eval(f'self.{self.__onto}.save({self.__filename}, format = "rdfxml")')
+        # write to a temporary file first and replace the kb file afterwards,
+        # that a failing save does not leave a truncated kb file behind
+        tmp_filename = f'{self.__filename}.tmp'
+        try:
+            getattr(self, self.__onto).save(file=tmp_filename, format='rdfxml')
+        except Exception:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
+        os.replace(tmp_filename, self.__filename)
+        self.__dirty = False
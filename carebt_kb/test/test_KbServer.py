@@ -20,6 +20,7 @@ from carebt_kb.kb_helper import create_update_request, create_update_items_reque
 from carebt_kb.kb_helper import create_delete_request, create_delete_items_request
 from carebt_kb.kb_helper import kb_rosstr_from_ros_msg
 from carebt_kb.kb_helper import dict_from_kb_response
+from carebt_kb.owlready2_kb import OwlReady2Kb
 from geometry_msgs.msg import PoseStamped
 import json
 import math
@@ -116,7 +117,33 @@ class TestKbServer():
         assert result[0]['first_name'] == 'Alice'
         assert result[1]['is_a'] == ['demo1.Person']
         assert result[1]['first_name'] == 'Bob'
-        
+
+    def test_read_datetime(self, execute_before_any_test):
+        kbserver = KbServer('carebt_kb')
+        kbserver._KbServer__kb = OwlReady2Kb('src/carebt_ros2/carebt_kb/test/data/test.owl')
+
+        # create
+        frame = {'type': 'test.Test',
+                 'test_datetime': '2022-02-22T21:55:59.123456',
+                 'test_date': '2022-02-22',
+                 'test_time': '21:55:59.123456'}
+        req = create_create_request(frame)
+        res = kbserver._KbServer__crud_query_callback(req, KbQuery.Response())
+        items = dict_from_kb_response(res)
+
+        # read
+        req = create_read_items_request(items)
+        res = kbserver._KbServer__crud_query_callback(req, KbQuery.Response())
+        result = dict_from_kb_response(res)
+
+        assert len(result) == 1
+        assert result[0]['test_datetime'] == '2022-02-22T21:55:59.123456'
+        assert result[0]['test_date'] == '2022-02-22'
+        assert result[0]['test_time'] == '21:55:59.123456'
+
+        # cleanup
+        req = create_delete_items_request(items)
+        kbserver._KbServer__crud_query_callback(req, KbQuery.Response())
 
     def test_update_age_of_bob(self, execute_before_any_test):
         kbserver = KbServer('carebt_kb')
@@ -178,6 +205,12 @@ class TestKbServer():
         assert math.isclose(p.pose.position.x, 1.0)
         assert math.isclose(p.pose.position.y, 2.0)
 
+    def test_is_individual_of(self, execute_before_any_test):
+        kbserver = KbServer('carebt_kb')
+
+        assert kbserver.is_individual_of('demo1.person1', 'demo1.Person') is True
+        assert kbserver.is_individual_of('demo1.person1', 'demo1.Robot') is False
+
     def test_delete_bob(self, execute_before_any_test):
         kbserver = KbServer('carebt_kb')
 
@@ -14,7 +14,11 @@
 
 import datetime
 import math
+import os
+import pytest
+import shutil
 from carebt_kb.owlready2_kb import OwlReady2Kb
+from owlready2 import World
 
 
 class TestOwlReady2Kb_TestOwl():
@@ -247,3 +251,59 @@ class TestOwlReady2Kb_TestOwl():
         assert r1[0]['has_subtest'][0] == 'test.subtest2'
         assert r1[0]['has_subtest'][1] == 'test.subtest3'
         assert r1[0]['has_subtest'][2] == 'test.subtest4'
+
+    def test_no_match_does_not_sync_to_file(self, tmp_path):
+        # setup
+        filename = str(tmp_path / 'test.owl')
+        shutil.copyfile('src/carebt_ros2/carebt_kb/test/data/test.owl', filename)
+        kb = OwlReady2Kb(filename, True)
+        inode = os.stat(filename).st_ino
+
+        # update and delete without matching items
+        kb.update({'type': 'test.Subtest', 'id': 'unknown'}, {'id': 'changed'})
+        kb.update_items([], {'id': 'changed'})
+        kb.delete({'type': 'test.Subtest', 'id': 'unknown'})
+        kb.delete_items([])
+
+        # the kb file is not rewritten
+        assert os.stat(filename).st_ino == inode
+
+    def test_save(self, tmp_path):
+        # setup
+        filename = str(tmp_path / 'test.owl')
+        shutil.copyfile('src/carebt_ros2/carebt_kb/test/data/test.owl', filename)
+        kb = OwlReady2Kb(filename)
+        inode = os.stat(filename).st_ino
+
+        kb.save()
+
+        # the kb file is replaced and no temporary file is left
+        assert os.stat(filename).st_ino != inode
+        assert os.listdir(tmp_path) == ['test.owl']
+
+        # reload
+        onto = World().get_ontology(filename).load()
+        assert onto.base_iri == 'http://test.org/test.owl#'
+        assert onto.Test is not None
+        assert onto.Subtest is not None
+
+    def test_save_failure(self, tmp_path):
+        # setup
+        filename = str(tmp_path / 'test.owl')
+        shutil.copyfile('src/carebt_ros2/carebt_kb/test/data/test.owl', filename)
+        kb = OwlReady2Kb(filename)
+
+        def failing_save(file, format):
+            with open(file, 'w') as f:
+                f.write('<?xml')
+            raise IOError('disk full')
+        kb.test.save = failing_save
+
+        with pytest.raises(IOError):
+            kb.save()
+
+        # the kb file is untouched and no temporary file is left
+        assert os.listdir(tmp_path) == ['test.owl']
+        with open(filename) as f, \
+                open('src/carebt_ros2/carebt_kb/test/data/test.owl') as orig:
+            assert f.read() == orig.read()
@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+from copy import deepcopy
+from functools import partial
+from time import monotonic_ns
 
 from action_msgs.msg import GoalStatus
 from carebt.actionNode import ActionNode
 from carebt.nodeStatus import NodeStatus
 from carebt.parallelNode import ParallelNode
 from carebt.rateControlNode import RateControlNode
-from carebt_nav2_pyutil.geometry_utils import calculate_remaining_path_length
+from carebt_nav2_pyutil.geometry_utils import calculate_cumulative_path_length
+from carebt_nav2_pyutil.geometry_utils import calculate_remaining_path_length_of_positions
 from carebt_nav2_pyutil.geometry_utils import calculate_travel_time
+from carebt_nav2_pyutil.geometry_utils import is_same_pose
+from carebt_nav2_pyutil.geometry_utils import path_to_positions
 from carebt_nav2_pyutil.robot_utils import get_current_pose
 from carebt_ros2.rosActionClientActionNode import RosActionClientActionNode
 from geometry_msgs.msg import PoseWithCovarianceStamped
@@ -29,10 +34,12 @@ from nav2_msgs.action import ComputePathThroughPoses
 from nav2_msgs.action import ComputePathToPose
 from nav2_msgs.action import FollowPath
 from nav2_msgs.action import NavigateToPose
+import numpy as np
 import rclpy
 from tf2_ros import TransformException
-import threading
-from time import sleep
+
+_ROBOT_FRAME = 'base_link'
+_GLOBAL_FRAME = 'map'
 
 ########################################################################
 
@@ -41,7 +48,8 @@ class InitPoseAction(ActionNode):
     """Publishes the current pose of the robot.
 
     Publishes the current pose of the robot to the '/initialpose' topic. This pose is used
-    by the localization component.
+    by the localization component. The publisher is created once and shared via the
+    `bt_runner` (`initial_pose_pub`).
 
     Input Parameters
     ----------------
@@ -54,21 +62,24 @@ class InitPoseAction(ActionNode):
         self.__bt_runner = bt_runner
 
     def on_init(self) -> None:
-        self.__initialpose_pub = self.__bt_runner.node.create_publisher(PoseWithCovarianceStamped,
-                                                                        '/initialpose',
-                                                                        10)
-        self.__initialpose_pub.publish(self._initial_pose)
+        if(getattr(self.__bt_runner, 'initial_pose_pub', None) is None):
+            self.__bt_runner.initial_pose_pub =\
+                self.__bt_runner.node.create_publisher(PoseWithCovarianceStamped,
+                                                       '/initialpose',
+                                                       10)
+        self.__bt_runner.initial_pose_pub.publish(self._initial_pose)
         self.set_status(NodeStatus.SUCCESS)
 
-    #def __del__(self) -> None:
-    #    self.__initialpose_pub.destroy()
-
 ########################################################################
 
 
 class WaitForLocalizationTF(ActionNode):
     """Waits for tf from map to base_link.
 
+    The node waits, event-driven, until the transform is available in the
+    shared tf buffer of the `bt_runner`. Afterwards, the transform is checked
+    periodically by a ROS2 timer until it matches the initial pose.
+
     Input Parameters
     ----------------
     ?initial_pose : geometry_msgs.msg.PoseWithCovarianceStamped
@@ -78,46 +89,62 @@ class WaitForLocalizationTF(ActionNode):
     def __init__(self, bt_runner):
         super().__init__(bt_runner, '?initial_pose')
         self._tf_buffer = bt_runner.tf_buffer
+        self.__ros_node = bt_runner.node
+        self.__timer = None
         self.set_timeout(5000)
 
     def on_init(self) -> None:
         self.set_status(NodeStatus.SUSPENDED)
-        self.__thread_running = True
-        self.__thread = threading.Thread(target=self.__worker)
-        self.__thread.start()
-
-    def __worker(self):
-        while True:
-            if(not self.__thread_running):
-                break
-            try:
-                now = rclpy.time.Time()
-                trans = self._tf_buffer.lookup_transform(
-                    'map',
-                    'base_link',
-                    now)
-
-                if(abs(trans.transform.translation.x - self._initial_pose.pose.pose.position.x)
-                        < math.sqrt(self._initial_pose.pose.covariance[0])
-                   and abs(trans.transform.translation.y - self._initial_pose.pose.pose.position.y)
-                        < math.sqrt(self._initial_pose.pose.covariance[7])):
-                    # AMCL pose ok
-                    self.get_logger().info('{} - localization pose ok'
-                                           .format(self.__class__.__name__))
-                    self.set_status(NodeStatus.SUCCESS)
-                    break
-            except TransformException:
-                pass
-
-            sleep(0.1)
+        # the initial pose does not change, so precompute the reference
+        # position and the accepted deviation (standard deviation)
+        self.__ref_x = self._initial_pose.pose.pose.position.x
+        self.__ref_y = self._initial_pose.pose.pose.position.y
+        self.__thr_x = math.sqrt(self._initial_pose.pose.covariance[0])
+        self.__thr_y = math.sqrt(self._initial_pose.pose.covariance[7])
+        future = self._tf_buffer.wait_for_transform_async(_GLOBAL_FRAME,
+                                                          _ROBOT_FRAME,
+                                                          rclpy.time.Time())
+        future.add_done_callback(self.__transform_available_callback)
+
+    def __transform_available_callback(self, future) -> None:
+        if(self.get_status() == NodeStatus.SUSPENDED and not self.__check_pose()):
+            self.__timer = self.__ros_node.create_timer(0.1, self.__check_pose)
+
+    def __check_pose(self) -> bool:
+        if(self.get_status() != NodeStatus.SUSPENDED):
+            self.__destroy_timer()
+            return False
+        try:
+            trans = self._tf_buffer.lookup_transform(
+                _GLOBAL_FRAME,
+                _ROBOT_FRAME,
+                rclpy.time.Time())
+        except TransformException:
+            return False
+
+        translation = trans.transform.translation
+        if(abs(translation.x - self.__ref_x) < self.__thr_x
+           and abs(translation.y - self.__ref_y) < self.__thr_y):
+            # AMCL pose ok
+            self.__destroy_timer()
+            self.get_logger().info('{} - localization pose ok'
+                                   .format(self.__class__.__name__))
+            self.set_status(NodeStatus.SUCCESS)
+            return True
+        return False
+
+    def __destroy_timer(self) -> None:
+        if(self.__timer is not None):
+            self.__ros_node.destroy_timer(self.__timer)
+            self.__timer = None
 
     def on_timeout(self) -> None:
-        self.__thread_running = False
+        self.__destroy_timer()
         self.set_status(NodeStatus.FAILURE)
         self.set_contingency_message('NOT_LOCALIZED')
 
-    #def __del__(self) -> None:
-    #    self.__initialpose_pub.destroy()
+    def on_abort(self) -> None:
+        self.__destroy_timer()
 
 ########################################################################
 
@@ -125,6 +152,10 @@ class WaitForLocalizationTF(ActionNode):
 class GetCurrentPose(ActionNode):
     """Returns the current pose of the robot.
 
+    The node waits, event-driven, until the transform is available in the
+    shared tf buffer of the `bt_runner`. If the pose can not be determined
+    immediately, it is retried periodically by a ROS2 timer.
+
     Output Parameters
     -----------------
     ?pose : geometry_msgs.msg.PoseStamped
@@ -134,35 +165,50 @@ class GetCurrentPose(ActionNode):
     def __init__(self, bt_runner):
         super().__init__(bt_runner, '=> ?pose')
         self._tf_buffer = self.bt_runner.tf_buffer
+        self._get_current_pose = partial(get_current_pose,
+                                         _GLOBAL_FRAME,
+                                         _ROBOT_FRAME,
+                                         self._tf_buffer)
+        self.__ros_node = bt_runner.node
+        self.__timer = None
         self.set_timeout(3000)
 
     def on_init(self) -> None:
         self.set_status(NodeStatus.SUSPENDED)
-        self.__thread_running = True
-        self.__thread = threading.Thread(target=self.__worker)
-        self.__thread.start()
-
-    def __worker(self):
-        while True:
-            if(not self.__thread_running):
-                break
-            # get current pose
-            robot_frame = 'base_link'
-            global_frame = 'map'
-            self._pose = get_current_pose(global_frame,
-                                        robot_frame,
-                                        self._tf_buffer)
-            if(self._pose is not None):
-                self.set_status(NodeStatus.SUCCESS)
-                break
-
-            sleep(0.1)
+        future = self._tf_buffer.wait_for_transform_async(_GLOBAL_FRAME,
+                                                          _ROBOT_FRAME,
+                                                          rclpy.time.Time())
+        future.add_done_callback(self.__transform_available_callback)
+
+    def __transform_available_callback(self, future) -> None:
+        if(self.get_status() == NodeStatus.SUSPENDED and not self.__update_pose()):
+            self.__timer = self.__ros_node.create_timer(0.1, self.__update_pose)
+
+    def __update_pose(self) -> bool:
+        if(self.get_status() != NodeStatus.SUSPENDED):
+            self.__destroy_timer()
+            return False
+        pose = self._get_current_pose()
+        if(pose is not None):
+            self.__destroy_timer()
+            self._pose = pose
+            self.set_status(NodeStatus.SUCCESS)
+            return True
+        return False
+
+    def __destroy_timer(self) -> None:
+        if(self.__timer is not None):
+            self.__ros_node.destroy_timer(self.__timer)
+            self.__timer = None
 
     def on_timeout(self) -> None:
-        self.__thread_running = False
+        self.__destroy_timer()
         self.set_status(NodeStatus.FAILURE)
         self.set_contingency_message('CURRENT_POSE_NOT_AVAILABLE')
 
+    def on_abort(self) -> None:
+        self.__destroy_timer()
+
 ########################################################################
 
 
@@ -196,9 +242,13 @@ class GetPoseWithCovFromPose(ActionNode):
         self._pose_with_cov = PoseWithCovarianceStamped()
         self._pose_with_cov.header = self._pose.header
         self._pose_with_cov.pose.pose = self._pose.pose
-        self._pose_with_cov.pose.covariance[0] = self._var_x
-        self._pose_with_cov.pose.covariance[7] = self._var_y
-        self._pose_with_cov.pose.covariance[35] = self._var_yaw
+        # assign a float64 array at once, the message setter accepts it
+        # without checking each element as it does for lists
+        covariance = np.zeros(36)
+        covariance[0] = float(self._var_x)
+        covariance[7] = float(self._var_y)
+        covariance[35] = float(self._var_yaw)
+        self._pose_with_cov.pose.covariance = covariance
         self.set_status(NodeStatus.SUCCESS)
 
 ########################################################################
@@ -207,6 +257,10 @@ class GetPoseWithCovFromPose(ActionNode):
 class ComputePathToPoseAction(RosActionClientActionNode):
     """Provides a path to the goal position.
 
+    If a start position is provided and neither the start nor the goal position
+    changed since the last successful planning, the planner is not called again
+    and the last path is kept.
+
     Input Parameters
     ----------------
     ?start : geometry_msgs.msg.PoseStamped
@@ -224,8 +278,29 @@ class ComputePathToPoseAction(RosActionClientActionNode):
     def __init__(self, bt_runner):
         super().__init__(bt_runner, ComputePathToPose, 'compute_path_to_pose',
                          '?start ?goal => ?path')
+        # the goal message is reused, only the dynamic fields are set on tick
+        self.__goal_template = self._goal_msg
+        self.__goal_template.planner_id = ''  # TODO: select planner from kb
+        self.__requested_start = None
+        self.__requested_goal = None
+        self.__planned_start = None
+        self.__planned_goal = None
+
+    def __is_planned(self) -> bool:
+        # without a start position the plan starts at the current pose of the
+        # robot, so it has to be recalculated even if the goal is unchanged
+        return (self._start is not None
+                and self.__planned_start is not None
+                and self._start.header.frame_id == self.__planned_start.header.frame_id
+                and self._goal.header.frame_id == self.__planned_goal.header.frame_id
+                and is_same_pose(self._start.pose, self.__planned_start.pose)
+                and is_same_pose(self._goal.pose, self.__planned_goal.pose))
 
     def on_tick(self) -> None:
+        if(self.__is_planned()):
+            self._goal_msg = None
+            return
+        self._goal_msg = self.__goal_template
         self.set_status(NodeStatus.SUSPENDED)
         if(self._start is not None):
             self._goal_msg.start = self._start
@@ -233,7 +308,10 @@ class ComputePathToPoseAction(RosActionClientActionNode):
         else:
             self._goal_msg.use_start = False
         self._goal_msg.goal = self._goal
-        self._goal_msg.planner_id = ''  # TODO: select planner from kb
+        # keep the poses sent with this goal, the result arrives on an
+        # executor thread and the input parameters may change in between
+        self.__requested_start = deepcopy(self._start)
+        self.__requested_goal = deepcopy(self._goal)
 
     def result_callback(self, future) -> None:
         path = future.result().result.path
@@ -244,6 +322,8 @@ class ComputePathToPoseAction(RosActionClientActionNode):
         else:
             self.get_logger().info(f'Path found with size: {len(path.poses)}')
             self._path = path
+            self.__planned_start = self.__requested_start
+            self.__planned_goal = self.__requested_goal
             self.set_status(NodeStatus.SUCCESS)
 
 
@@ -270,6 +350,8 @@ class ComputePathThroughPosesAction(RosActionClientActionNode):
     def __init__(self, bt_runner):
         super().__init__(bt_runner, ComputePathThroughPoses,
                          'compute_path_through_poses', '?start ?goals => ?path')
+        # the goal message is reused, only the dynamic fields are set on tick
+        self._goal_msg.planner_id = ''  # TODO: select planner from kb
 
     def on_tick(self) -> None:
         self.set_status(NodeStatus.SUSPENDED)
@@ -279,7 +361,6 @@ class ComputePathThroughPosesAction(RosActionClientActionNode):
         else:
             self._goal_msg.use_start = False
         self._goal_msg.goals = self._goals
-        self._goal_msg.planner_id = ''  # TODO: select planner from kb   
 
     def result_callback(self, future) -> None:
         self._path = future.result().result.path
@@ -383,31 +464,43 @@ class CreateFollowPathFeedback(ActionNode):
     def __init__(self, bt_runner):
         super().__init__(bt_runner, '?path => ?feedback')
         self._feedback = NavigateToPose.Feedback()
-        self._start_time = datetime.now()
+        self._start_time_ns = monotonic_ns()
         self._tf_buffer = self.bt_runner.tf_buffer
         self._odom_smoother = bt_runner.odom_smoother
+        self._get_current_pose = partial(get_current_pose,
+                                         _GLOBAL_FRAME,
+                                         _ROBOT_FRAME,
+                                         self._tf_buffer)
+        self._get_twist = self._odom_smoother.get_twist
+        # positions and cumulative lengths of the path, calculated once per path
+        self.__positions_path = None
+        self.__path_positions = None
+        self.__cumulative_path_length = None
 
     def on_tick(self) -> None:
         # get current pose
-        robot_frame = 'base_link'
-        global_frame = 'map'
-        current_pose = get_current_pose(global_frame,
-                                        robot_frame,
-                                        self._tf_buffer)
+        current_pose = self._get_current_pose()
         if(current_pose is not None):
             self._feedback.current_pose = current_pose
 
         # remaining path length
         if(self._path is not None and current_pose is not None):
+            if(self._path is not self.__positions_path):
+                self.__positions_path = self._path
+                self.__path_positions = path_to_positions(self._path)
+                self.__cumulative_path_length =\
+                    calculate_cumulative_path_length(self.__path_positions)
             self._feedback.distance_remaining =\
-                calculate_remaining_path_length(self._path, current_pose)
+                calculate_remaining_path_length_of_positions(self.__path_positions,
+                                                             self.__cumulative_path_length,
+                                                             current_pose)
 
         # navigation_time since start
-        delta = (datetime.now() - self._start_time).total_seconds()
-        self._feedback.navigation_time.sec = int(delta)
+        self._feedback.navigation_time.sec =\
+            (monotonic_ns() - self._start_time_ns) // 1_000_000_000
 
         # estimated_time_remaining
-        twist = self._odom_smoother.get_twist()
+        twist = self._get_twist()
         self._feedback.estimated_time_remaining.sec =\
             calculate_travel_time(twist, self._feedback.distance_remaining)
 
@@ -428,15 +521,20 @@ class FollowPathAction(RosActionClientActionNode):
 
     def __init__(self, bt_runner):
         super().__init__(bt_runner, FollowPath, 'follow_path', '?path')
+        # the goal message is reused, only the path is set for a new path
+        self.__goal_template = self._goal_msg
         self._current_path = None
 
     def on_tick(self) -> None:
         self._goal_msg = None
         # if there is a path
         if(self._path is not None):
-            # if the path is new
-            if(self._current_path != self._path):
-                self._goal_msg = FollowPath.Goal()
+            # if the path is new (a new plan has a new stamp, so there is no need
+            # to compare all poses of the path)
+            if(self._current_path is not self._path
+               and (self._current_path is None
+                    or self._current_path.header.stamp != self._path.header.stamp)):
+                self._goal_msg = self.__goal_template
                 self._goal_msg.path = self._path
                 self._current_path = self._path
 
@@ -21,7 +21,6 @@ from rcl_interfaces.srv import SetParameters
 from ros2param.api import get_parameter_value
 from std_msgs.msg import Empty
 from threading import Timer, Thread
-from time import sleep
 
 ########################################################################
 
@@ -127,13 +126,14 @@ class LifecycleClient(ActionNode):
     def __init__(self, bt_runner):
         super().__init__(bt_runner, '?node ?id')
         self.__bt_runner = bt_runner
+        self.__timer = None
+        self.__get_state_future = None
         self.set_timeout(25000)
 
     def on_init(self) -> None:
         self.get_logger().info('{} - put {} into state {}'
                                .format(self.__class__.__name__, self._node, self._id))
         self.set_status(NodeStatus.SUSPENDED)
-        self.__thread_running = True
         self.__expected_goal_state = [0, 2, 1, 3, 2, 4, 4, 4][self._id]
         Thread(target=self.__worker, daemon=True).start()
         
@@ -150,24 +150,39 @@ class LifecycleClient(ActionNode):
             if not res.success:
                 self.set_status(NodeStatus.FAILURE)
                 self.set_contingency_message('CHANGE_STATE_FAILED')
+                return
         else:
             self.get_logger().warn('service not available')
             self.set_status(NodeStatus.FAILURE)
             self.set_contingency_message('SERVICE_NOT_AVAILABLE')
+            return
+
+        # poll the state of the node on the executor until the expected state is reached
+        if(self.get_status() == NodeStatus.SUSPENDED):
+            self.__timer = self.__bt_runner.node.create_timer(0.1, self.__get_state)
+
+    def __get_state(self) -> None:
+        if(self.get_status() != NodeStatus.SUSPENDED):
+            self.__destroy_timer()
+        # only one request at a time
+        elif(self.__get_state_future is None or self.__get_state_future.done()):
+            self.__get_state_future = self.__get_state_client.call_async(GetState.Request())
+            self.__get_state_future.add_done_callback(self.__get_state_callback)
+
+    def __get_state_callback(self, future) -> None:
+        res: GetState.Response = future.result()
+        if(self.get_status() == NodeStatus.SUSPENDED
+           and res.current_state.id == self.__expected_goal_state):
+            self.__destroy_timer()
+            self.set_status(NodeStatus.SUCCESS)
 
-        while True:
-            if(not self.__thread_running):
-                break
-            req = GetState.Request()
-            res: GetState.Response = self.__get_state_client.call(req)
-            if res.current_state.id == self.__expected_goal_state:
-                self.set_status(NodeStatus.SUCCESS)
-                break
-            sleep(0.1)
-
+    def __destroy_timer(self) -> None:
+        if(self.__timer is not None):
+            self.__bt_runner.node.destroy_timer(self.__timer)
+            self.__timer = None
 
     def on_timeout(self) -> None:
-        self.__thread_running = False
+        self.__destroy_timer()
         self.set_status(NodeStatus.FAILURE)
         self.set_contingency_message('TIMEOUT')
 
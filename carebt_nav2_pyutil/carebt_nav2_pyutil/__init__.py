@@ -12,17 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from carebt_nav2_pyutil.geometry_utils import calculate_cumulative_path_length
 from carebt_nav2_pyutil.geometry_utils import calculate_path_length
 from carebt_nav2_pyutil.geometry_utils import calculate_remaining_path_length
+from carebt_nav2_pyutil.geometry_utils import calculate_remaining_path_length_of_positions
 from carebt_nav2_pyutil.geometry_utils import calculate_travel_time
 from carebt_nav2_pyutil.geometry_utils import euclidean_distance
+from carebt_nav2_pyutil.geometry_utils import is_same_pose
+from carebt_nav2_pyutil.geometry_utils import path_to_positions
 
 from carebt_nav2_pyutil.robot_utils import get_current_pose
 
 
-__all__ = ['calculate_path_length',
+__all__ = ['calculate_cumulative_path_length',
+           'calculate_path_length',
            'calculate_remaining_path_length',
+           'calculate_remaining_path_length_of_positions',
            'calculate_travel_time',
            'euclidean_distance',
            'get_current_pose',
+           'is_same_pose',
+           'path_to_positions',
            ]
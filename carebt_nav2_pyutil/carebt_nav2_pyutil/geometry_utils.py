@@ -16,6 +16,12 @@ import math
 
 from geometry_msgs.msg import Pose, PoseStamped, Twist
 from nav_msgs.msg import Path
+import numpy as np
+
+# a path pose closer than this distance to the robot is the start of the
+# remaining path
+# TODO remove magic number 0.5
+_CLOSE_POSE_DISTANCE = 0.5
 
 
 def euclidean_distance(pos1: Pose, pos2: Pose) -> float:
@@ -41,6 +47,39 @@ def euclidean_distance(pos1: Pose, pos2: Pose) -> float:
     return math.sqrt(dx * dx + dy * dy + dz * dz)
 
 
+def is_same_pose(pose1: Pose,
+                 pose2: Pose,
+                 position_tolerance: float = 0.001,
+                 orientation_tolerance: float = math.radians(0.1)) -> bool:
+    """
+    Check if 2 geometry_msgs::Poses are the same within the provided tolerances.
+
+    Parameters
+    ----------
+    pose1: geometry_msgs.msg.Pose
+        First pose
+    pose2: geometry_msgs.msg.Pose
+        Second pose
+    position_tolerance: float = 0.001
+        Maximum L2 distance of the positions [m]
+    orientation_tolerance: float = math.radians(0.1)
+        Maximum angle between the orientations [rad]
+
+    Returns
+    -------
+    bool
+        True if the poses are the same
+
+    """
+    if(euclidean_distance(pose1, pose2) > position_tolerance):
+        return False
+    q1 = pose1.orientation
+    q2 = pose2.orientation
+    dot = q1.x * q2.x + q1.y * q2.y + q1.z * q2.z + q1.w * q2.w
+    # the angle between two orientations is 2 * acos(|dot|)
+    return abs(dot) >= math.cos(orientation_tolerance / 2)
+
+
 def calculate_path_length(path: Path, start_index: int = 0) -> float:
     """
     Calculate the length of the provided path, starting at the provided index.
@@ -87,13 +126,90 @@ def calculate_remaining_path_length(path: Path, pose: PoseStamped) -> float:
     closest_pose_idx = 0
     for idx, path_pose in enumerate(path.poses):
         curr_dist = euclidean_distance(pose.pose, path_pose.pose)
-        # TODO remove magic number 0.5
-        if (curr_dist < 0.5):
+        if (curr_dist < _CLOSE_POSE_DISTANCE):
             closest_pose_idx = idx
             break
     return calculate_path_length(path, closest_pose_idx)
 
 
+def path_to_positions(path: Path) -> np.ndarray:
+    """
+    Get the positions of the poses of the provided path as array.
+
+    Parameters
+    ----------
+    path: nav_msgs.msg.Path
+        The planned path with the poses
+
+    Returns
+    -------
+    numpy.ndarray
+        Array with shape (N, 3) containing the x, y, z positions of the N poses
+
+    """
+    return np.fromiter((coordinate
+                        for pose_stamped in path.poses
+                        for coordinate in (pose_stamped.pose.position.x,
+                                           pose_stamped.pose.position.y,
+                                           pose_stamped.pose.position.z)),
+                       dtype=np.float64,
+                       count=3 * len(path.poses)).reshape(-1, 3)
+
+
+def calculate_cumulative_path_length(positions: np.ndarray) -> np.ndarray:
+    """
+    Calculate the path length from the first position up to each position.
+
+    Parameters
+    ----------
+    positions: numpy.ndarray
+        Array with shape (N, 3) as returned by `path_to_positions`
+
+    Returns
+    -------
+    numpy.ndarray
+        Array with shape (N,) containing the cumulative path lengths
+
+    """
+    segment_lengths = np.linalg.norm(np.diff(positions, axis=0), axis=1)
+    return np.concatenate(([0.0], np.cumsum(segment_lengths)))
+
+
+def calculate_remaining_path_length_of_positions(positions: np.ndarray,
+                                                 cumulative_path_length: np.ndarray,
+                                                 pose: PoseStamped) -> float:
+    """
+    Calculate the length of the provided path, starting at the provided pose.
+
+    Same as `calculate_remaining_path_length`, but on the precalculated positions
+    and cumulative path lengths of the path. This avoids iterating over all poses
+    of the path if the remaining path length is calculated repeatedly for the
+    same path.
+
+    Parameters
+    ----------
+    positions: numpy.ndarray
+        Array with shape (N, 3) as returned by `path_to_positions`
+    cumulative_path_length: numpy.ndarray
+        Array with shape (N,) as returned by `calculate_cumulative_path_length`
+    pose: geometry_msgs.msg.PoseStamped
+        The pose to calculate the remaining path length from
+
+    Returns
+    -------
+    float
+        Path length
+
+    """
+    if(len(positions) == 0):
+        return 0.0
+    position = pose.pose.position
+    squared_dist = np.sum((positions - (position.x, position.y, position.z))**2, axis=1)
+    close_pose_indices = np.flatnonzero(squared_dist < _CLOSE_POSE_DISTANCE**2)
+    closest_pose_idx = close_pose_indices[0] if len(close_pose_indices) > 0 else 0
+    return float(cumulative_path_length[-1] - cumulative_path_length[closest_pose_idx])
+
+
 def calculate_travel_time(twist: Twist, path_length: float) -> int:
     """
     Calculate the time to travel the path given the provided speed (twist).
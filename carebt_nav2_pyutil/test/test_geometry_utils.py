@@ -14,8 +14,24 @@
 
 import math
 
+from carebt_nav2_pyutil.geometry_utils import calculate_cumulative_path_length
+from carebt_nav2_pyutil.geometry_utils import calculate_remaining_path_length
+from carebt_nav2_pyutil.geometry_utils import calculate_remaining_path_length_of_positions
 from carebt_nav2_pyutil.geometry_utils import euclidean_distance
-from geometry_msgs.msg import Pose
+from carebt_nav2_pyutil.geometry_utils import is_same_pose
+from carebt_nav2_pyutil.geometry_utils import path_to_positions
+from geometry_msgs.msg import Pose, PoseStamped
+from nav_msgs.msg import Path
+
+
+def create_path(positions: list) -> Path:
+    path = Path()
+    for x, y in positions:
+        pose = PoseStamped()
+        pose.pose.position.x = x
+        pose.pose.position.y = y
+        path.poses.append(pose)
+    return path
 
 
 class Test_euclidean_distance():
@@ -28,3 +44,67 @@ class Test_euclidean_distance():
         p2.position.x = 5.0
         p2.position.y = 5.0
         assert math.isclose(euclidean_distance(p1, p2), 5.656854249492381)
+
+
+class Test_is_same_pose():
+
+    def test_is_same_pose(self):
+        p1 = Pose()
+        p1.position.x = 1.0
+        p2 = Pose()
+        p2.position.x = 1.0005
+        assert is_same_pose(p1, p2)
+        p2.position.x = 1.01
+        assert not is_same_pose(p1, p2)
+
+    def test_is_same_pose_orientation(self):
+        p1 = Pose()
+        p2 = Pose()
+        # rotated by 0.05 degrees around z
+        p2.orientation.z = math.sin(math.radians(0.05) / 2)
+        p2.orientation.w = math.cos(math.radians(0.05) / 2)
+        assert is_same_pose(p1, p2)
+        # rotated by 1 degree around z
+        p2.orientation.z = math.sin(math.radians(1.0) / 2)
+        p2.orientation.w = math.cos(math.radians(1.0) / 2)
+        assert not is_same_pose(p1, p2)
+        # same orientation, negated quaternion
+        p2.orientation.z = -0.0
+        p2.orientation.w = -1.0
+        assert is_same_pose(p1, p2)
+
+
+class Test_calculate_remaining_path_length_of_positions():
+
+    def test_path_to_positions(self):
+        path = create_path([(0.0, 0.0), (1.0, 2.0)])
+        positions = path_to_positions(path)
+        assert positions.shape == (2, 3)
+        assert positions[1].tolist() == [1.0, 2.0, 0.0]
+
+    def test_cumulative_path_length(self):
+        path = create_path([(0.0, 0.0), (3.0, 4.0), (3.0, 5.0)])
+        cumulative_path_length = calculate_cumulative_path_length(path_to_positions(path))
+        assert cumulative_path_length.tolist() == [0.0, 5.0, 6.0]
+
+    def test_remaining_path_length(self):
+        path = create_path([(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (2.0, 1.0), (2.0, 2.0)])
+        positions = path_to_positions(path)
+        cumulative_path_length = calculate_cumulative_path_length(positions)
+        pose = PoseStamped()
+        for x, y in [(0.0, 0.0), (1.1, 0.1), (2.0, 1.6), (5.0, 5.0)]:
+            pose.pose.position.x = x
+            pose.pose.position.y = y
+            assert math.isclose(
+                calculate_remaining_path_length_of_positions(positions,
+                                                             cumulative_path_length,
+                                                             pose),
+                calculate_remaining_path_length(path, pose))
+
+    def test_remaining_path_length_empty_path(self):
+        path = Path()
+        positions = path_to_positions(path)
+        cumulative_path_length = calculate_cumulative_path_length(positions)
+        assert calculate_remaining_path_length_of_positions(positions,
+                                                            cumulative_path_length,
+                                                            PoseStamped()) == 0.0
@@ -16,6 +16,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from action_msgs.msg import GoalStatus
+from carebt.abstractLogger import LogLevel
 from carebt.actionNode import ActionNode
 from carebt.nodeStatus import NodeStatus
 from rclpy.action import ActionClient
@@ -25,6 +26,20 @@ from rclpy.task import Future
 if TYPE_CHECKING:
     from carebt.behaviorTreeRunner import BehaviorTreeRunner  # pragma: no cover
 
+# action clients shared by all node instances,
+# indexed by (id(ros_node), action_type, action_name)
+_ACTION_CLIENT_POOL = {}
+
+
+def _get_action_client(ros_node, action_type, action_name: str) -> ActionClient:
+    key = (id(ros_node), action_type, action_name)
+    action_client = _ACTION_CLIENT_POOL.get(key)
+    if action_client is None:
+        action_client = ActionClient(ros_node, action_type, action_name)
+        _ACTION_CLIENT_POOL[key] = action_client
+    return action_client
+
+
 class RosActionClientActionNode(ActionNode):
 
     def __init__(self,
@@ -36,7 +51,7 @@ class RosActionClientActionNode(ActionNode):
         self.set_status(NodeStatus.IDLE)
         self._goal_handle: ClientGoalHandle
         self._goal_msg = action_type.Goal()
-        self._action_client = ActionClient(bt_runner.node, action_type, action_name)
+        self._action_client = _get_action_client(bt_runner.node, action_type, action_name)
         self.get_logger().debug('{} - action_client.wait_for_server...'
                                 .format(self.__class__.__name__))
         self._action_client.wait_for_server()  # TODO: Timeout
@@ -63,7 +78,11 @@ class RosActionClientActionNode(ActionNode):
     def _internal_on_delete(self) -> None:
         if self._get_result_future is not None:
             self._get_result_future._callbacks = []
-        self._action_client._feedback_callbacks = {}
+        # the action client is shared, so only remove the feedback callbacks of this node
+        feedback_callbacks = self._action_client._feedback_callbacks
+        for goal_uuid in [goal_uuid for goal_uuid, callback in list(feedback_callbacks.items())
+                          if callback == self.feedback_callback]:
+            del feedback_callbacks[goal_uuid]
         super()._internal_on_delete()
 
     def _internal_result_callback(self, future: Future) -> None:
@@ -86,9 +105,12 @@ class RosActionClientActionNode(ActionNode):
                 int((current_ts - self._last_ts).total_seconds() * 1000) >= self._throttle_ms):
             if(self.get_status() == NodeStatus.IDLE or
                     self.get_status() == NodeStatus.RUNNING):
-                self.bt_runner.get_logger().trace('ticking {} - {}'
-                                                  .format(self.__class__.__name__,
-                                                          self.get_status()))
+                # the carebt logger takes preformatted messages only, so check the
+                # log level first to avoid formatting the message on every tick
+                logger = self.bt_runner.get_logger()
+                if(logger._log_level <= LogLevel.TRACE):
+                    logger.trace('ticking {} - {}'
+                                 .format(self.__class__.__name__, self.get_status()))
                 if self.get_status() == NodeStatus.IDLE:
                     self.set_status(NodeStatus.RUNNING)
                 self.on_tick()
@@ -24,38 +24,37 @@ from rclpy.node import Node
 ########################################################################
 
 
-class _BtNode(Thread):
-
-    def __init__(self, ros_node: Node):
-        Thread.__init__(self, target=self.thread, daemon=True)
-        self.__ros_node = ros_node
-       
-        # Use a MultiThreadedExecutor to enable processing goals concurrently
-        self.__executor = MultiThreadedExecutor()
-        self.__bt_runner = BehaviorTreeRunner()
-        self.__bt_runner.get_logger().set_log_level(LogLevel.INFO)
-
-    def thread(self):
-        rclpy.spin(self.__ros_node, executor=self.__executor)
-
-    def run_node(self, node: TreeNode, params: str = None):
-        self.__bt_runner.node = self.__ros_node
-        self.__bt_runner.run(node, params)
-
-    def get_bt_runner(self) -> BehaviorTreeRunner:
-        return self.__bt_runner
-
-########################################################################
+class RosCarebtRunner(Node):
 
+    def __init__(self, node_name: str = 'carebt_runner', num_threads: int = None):
+        """
+        Create the ROS2 node and start spinning it.
 
-class RosCarebtRunner(Node):
+        Parameters
+        ----------
+        node_name: str, optional
+            The name of the ROS2 node
+        num_threads: int, optional
+            The number of threads of the executor which processes the callbacks
+            (subscriptions, timers, action clients, ...) of the ROS2 node. If not
+            set, the default of the `MultiThreadedExecutor` (`os.cpu_count()`) is
+            used. Note that the execute callback of each active (or preempted)
+            `RosActionServerSequenceNode` goal blocks one thread
 
-    def __init__(self, node_name: str = 'carebt_runner'):
+        """
         rclpy.init(args=None)
         Node.__init__(self, node_name)
 
-        self.__btNode = _BtNode(self)
-        self.__btNode.start()
+        self.__bt_runner = BehaviorTreeRunner()
+        self.__bt_runner.get_logger().set_log_level(LogLevel.INFO)
+        self.__bt_runner.node = self
+
+        # Use a MultiThreadedExecutor to enable processing goals concurrently.
+        # The executor spins in its own thread, the behavior tree runs in the
+        # thread calling `run`.
+        self.__executor = MultiThreadedExecutor(num_threads=num_threads)
+        self.__executor.add_node(self)
+        Thread(target=self.__executor.spin, daemon=True).start()
 
     def run(self, node: TreeNode, params: str = None) -> None:
         """
@@ -69,7 +68,7 @@ class RosCarebtRunner(Node):
             The parameters for the node which should be executed
 
         """
-        self.__btNode.run_node(node, params)
+        self.__bt_runner.run(node, params)
 
     def get_bt_runner(self) -> BehaviorTreeRunner:
-        return self.__btNode.get_bt_runner()
+        return self.__bt_runner